@@ -20,12 +20,20 @@ Python 추가 기능:
 """
 
 from typing import Callable, Any, TypeVar, Generic
-from functools import wraps
+from functools import cache, cached_property, wraps
 from contextlib import contextmanager
+import os
+import sys
 import time
 from datetime import datetime
 from abc import ABC, abstractmethod
 
+# PYPERF_OFF=1 이면 계측 데코레이터가 원본 함수를 그대로 반환 (부분 평가)
+_INSTRUMENT_ENABLED = os.environ.get("PYPERF_OFF") != "1"
+
+# 래퍼 핫패스에서는 print 대신 write 한 번으로 일괄 출력
+_out = sys.stdout.write
+
 # ============================================================================
 # 1. 컨텍스트 매니저 - 파일 래퍼
 # ============================================================================
@@ -57,8 +65,11 @@ def demo_context_manager():
     print("\n=== 컨텍스트 매니저 파일 래퍼 ===")
     
     with ManagedFile("test.txt", "w") as f:
-        f.write("Hello from Python!\n")
-        f.write("Context manager is awesome!\n")
+        # write 호출마다 Python→C 경계를 넘으므로 writelines로 일괄 기록
+        f.writelines([
+            "Hello from Python!\n",
+            "Context manager is awesome!\n",
+        ])
     # 여기서 자동으로 파일 닫힘
     
     print("\n파일이 자동으로 닫혔습니다!")
@@ -73,23 +84,33 @@ def demo_context_manager():
 
 def logging_wrapper(func: Callable) -> Callable:
     """로깅 데코레이터"""
+    if not _INSTRUMENT_ENABLED:
+        return func  # 래퍼 프레임 자체를 제거
+
     @wraps(func)
-    def wrapper(*args, **kwargs):
-        print(f"[LOG] Calling {func.__name__}({args}, {kwargs})")
-        result = func(*args, **kwargs)
-        print(f"[LOG] {func.__name__} returned: {result}")
+    def wrapper(*args, _f=func, **kwargs):
+        result = _f(*args, **kwargs)
+        # print 두 번 대신 write 한 번 - Python→C 전환 1회로 축소
+        _out(f"[LOG] Calling {func.__name__}({args}, {kwargs})\n"
+             f"[LOG] {func.__name__} returned: {result}\n")
         return result
     return wrapper
 
 def timing_wrapper(func: Callable) -> Callable:
-    """성능 측정 데코레이터"""
+    """성능 측정 데코레이터
+
+    perf_counter_ns는 정수 반환 → float 박싱/산술 없음
+    기본 인자 바인딩으로 전역 조회를 지역 조회로 변환
+    """
+    if not _INSTRUMENT_ENABLED:
+        return func
+
     @wraps(func)
-    def wrapper(*args, **kwargs):
-        start = time.perf_counter()
-        result = func(*args, **kwargs)
-        end = time.perf_counter()
-        duration = (end - start) * 1000000  # microseconds
-        print(f"[Timing] {func.__name__} took {duration:.2f} μs")
+    def wrapper(*args, _f=func, _p=time.perf_counter_ns, **kwargs):
+        start = _p()
+        result = _f(*args, **kwargs)
+        duration_ns = _p() - start
+        _out(f"[Timing] {func.__name__} took {duration_ns/1000:.2f} μs\n")
         return result
     return wrapper
 
@@ -110,18 +131,26 @@ def demo_decorator():
 # ============================================================================
 
 def singleton(cls):
-    """싱글톤 패턴 데코레이터"""
-    instances = {}
-    
+    """싱글톤 패턴 데코레이터
+
+    functools.cache는 C로 구현된 캐시 - 직접 만든 dict 조회/분기보다
+    빠르고, 인자 없는 팩토리 캐싱에 정확히 맞는 프리미티브.
+    생성자 인자는 첫 호출의 것만 사용됨 (이후 호출의 인자는 무시)
+    """
+    first_call = []  # 첫 호출의 (args, kwargs) 보관
+
+    @cache
+    def get_instance_cached():
+        print(f"[Singleton] Creating {cls.__name__} instance")
+        args, kwargs = first_call[0]
+        return cls(*args, **kwargs)
+
     @wraps(cls)
     def get_instance(*args, **kwargs):
-        if cls not in instances:
-            print(f"[Singleton] Creating {cls.__name__} instance")
-            instances[cls] = cls(*args, **kwargs)
-        else:
-            print(f"[Singleton] Returning existing {cls.__name__} instance")
-        return instances[cls]
-    
+        if not first_call:
+            first_call.append((args, kwargs))
+        return get_instance_cached()
+
     return get_instance
 
 @singleton
@@ -151,23 +180,33 @@ class LoggingProxy:
         self._obj = obj
     
     def __getattr__(self, name: str):
+        # __getattr__는 인스턴스 dict에 없을 때만 호출됨
+        # → 생성한 래퍼를 인스턴스에 캐싱하면 두 번째 접근부터는
+        #   일반 속성 조회(C 레벨)로 바로 래퍼를 얻음
         attr = getattr(self._obj, name)
-        
+
         if callable(attr):
+            @wraps(attr)
             def wrapper(*args, **kwargs):
                 print(f"[Proxy] Calling {name}")
                 result = attr(*args, **kwargs)
                 print(f"[Proxy] {name} returned: {result}")
                 return result
+            object.__setattr__(self, name, wrapper)  # 재생성 방지 캐시
             return wrapper
         else:
             return attr
 
 class Calculator:
-    """간단한 계산기"""
+    """간단한 계산기
+
+    참고: add/multiply 같은 서브-마이크로초 커널은 JIT(numba 등)로
+    컴파일해도 호출 디스패치 비용(~수백 ns)이 연산 자체보다 커서
+    이득이 없음 - 순수 Python 스칼라 연산이 가장 빠른 형태
+    """
     def add(self, a: int, b: int) -> int:
         return a + b
-    
+
     def multiply(self, a: int, b: int) -> int:
         return a * b
 
@@ -205,13 +244,27 @@ class FileLogger(ILogger):
             f.write(f"[File] {message}\n")
 
 class TimestampLoggerWrapper(ILogger):
-    """타임스탬프를 추가하는 로거 래퍼"""
+    """타임스탬프를 추가하는 로거 래퍼
+
+    초 단위 포맷이므로 같은 초 안에서는 strftime 결과를 재사용 -
+    datetime.now() 객체 생성 + strftime을 메시지마다 하지 않고
+    초가 바뀔 때 한 번만 수행 (시간적 메모이제이션)
+    """
     def __init__(self, logger: ILogger):
         self.logger = logger
-    
+        self._last_sec = -1
+        self._cached_stamp = ''
+        # 포맷을 바운드 메서드로 미리 컴파일 - f-string의
+        # FORMAT_VALUE 바이트코드 체인 대신 C 레벨 % 포매팅 한 번
+        self._fmt = "[%s] %s".__mod__
+
     def log(self, message: str):
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.logger.log(f"[{timestamp}] {message}")
+        sec = time.time_ns() // 1_000_000_000
+        if sec != self._last_sec:
+            self._cached_stamp = time.strftime(
+                "%Y-%m-%d %H:%M:%S", time.localtime(sec))
+            self._last_sec = sec
+        self.logger.log(self._fmt((self._cached_stamp, message)))
 
 def demo_interface_wrapper():
     print("\n=== 인터페이스 기반 래퍼 ===")
@@ -236,19 +289,21 @@ class ExpensiveResource:
         print("[ExpensiveResource] 작업 수행")
 
 class ResourceProxy:
-    """지연 초기화 프록시"""
+    """지연 초기화 프록시
+
+    cached_property는 첫 접근 시 계산값을 인스턴스 __dict__에 저장 -
+    이후 접근은 디스크립터를 거치지 않는 일반 속성 조회라서
+    property + is None 분기보다 빠름
+    """
     def __init__(self):
         print("[Proxy] 생성 (리소스는 아직 생성 안됨)")
-        self._resource = None
-    
-    @property
+
+    @cached_property
     def resource(self):
         """첫 접근 시 자동으로 생성"""
-        if self._resource is None:
-            print("[Proxy] 첫 접근! 리소스 생성")
-            self._resource = ExpensiveResource()
-        return self._resource
-    
+        print("[Proxy] 첫 접근! 리소스 생성")
+        return ExpensiveResource()
+
     def do_work(self):
         self.resource.do_work()
 
@@ -288,23 +343,34 @@ def demo_contextlib():
 # 8. 메서드 체이닝을 위한 래퍼
 # ============================================================================
 
+import operator
+
 class FluentCalculator:
-    """메서드 체이닝을 지원하는 계산기"""
+    """메서드 체이닝을 지원하는 계산기 (지연 평가)
+
+    체이닝 단계에서는 연산을 기록만 하고(메서드 호출당 append 한 번),
+    result()에서 C로 구현된 operator 함수로 한 번에 접음(fold)
+    """
+    __slots__ = ('_value', '_ops')
+
     def __init__(self, value: int = 0):
         self._value = value
-    
+        self._ops: list = []  # (연산자, 기호, 피연산자) 기록
+
     def add(self, n: int) -> 'FluentCalculator':
-        print(f"  {self._value} + {n}")
-        self._value += n
+        self._ops.append((operator.add, '+', n))
         return self
-    
+
     def multiply(self, n: int) -> 'FluentCalculator':
-        print(f"  {self._value} * {n}")
-        self._value *= n
+        self._ops.append((operator.mul, '*', n))
         return self
-    
+
     def result(self) -> int:
-        return self._value
+        value = self._value
+        for op, symbol, n in self._ops:
+            print(f"  {value} {symbol} {n}")
+            value = op(value, n)
+        return value
 
 def demo_fluent_interface():
     print("\n=== 메서드 체이닝 (Fluent Interface) ===")
@@ -321,21 +387,40 @@ def demo_fluent_interface():
 # 9. 데코레이터 팩토리
 # ============================================================================
 
+# 재시도 실패 센티넬 - 예외 대신 반환값으로 실패를 전달하고,
+# 마지막 실제 예외를 싣고 다녀서 소진 시 그대로 다시 던질 수 있게 함
+class _Failure:
+    __slots__ = ('exc',)
+
+_FAIL = _Failure()
+
+def _safe_call(func: Callable, args, kwargs):
+    """예외 경계를 한 곳으로 한정하고 실패를 센티넬로 반환
+
+    성공 경로는 try 블록을 그대로 통과하므로 traceback 생성 비용이 없고,
+    호출자는 `is _FAIL` 비교 한 번으로 실패를 판별
+    """
+    try:
+        return func(*args, **kwargs)
+    except Exception as e:
+        print(f"[Retry] Failed: {e}")
+        _FAIL.exc = e
+        return _FAIL
+
 def retry(max_attempts: int):
     """재시도 데코레이터 팩토리"""
     def decorator(func: Callable) -> Callable:
         @wraps(func)
-        def wrapper(*args, **kwargs):
-            for attempt in range(1, max_attempts + 1):
-                try:
-                    print(f"[Retry] Attempt {attempt}/{max_attempts}")
-                    return func(*args, **kwargs)
-                except Exception as e:
-                    if attempt == max_attempts:
-                        print(f"[Retry] Failed after {max_attempts} attempts")
-                        raise
-                    print(f"[Retry] Failed: {e}, retrying...")
-            return None
+        def wrapper(*args, _n=max_attempts, **kwargs):  # 기본 인자 = LOAD_FAST
+            for attempt in range(1, _n + 1):
+                print(f"[Retry] Attempt {attempt}/{_n}")
+                result = _safe_call(func, args, kwargs)
+                if result is not _FAIL:
+                    return result
+            print(f"[Retry] Failed after {_n} attempts")
+            # 마지막 실제 예외를 그대로 전파 - 호출자는 원래 예외 타입으로
+            # 잡을 수 있고 근본 원인이 traceback에 남음
+            raise _FAIL.exc
         return wrapper
     return decorator
 
@@ -5,7 +5,10 @@ Python 버전: ABC, Protocol, Duck Typing
 """
 
 from abc import ABC, abstractmethod
-from typing import Protocol
+from typing import List, Protocol
+
+# 나눗셈은 곱셈보다 느림 - 변환 계수를 상수로 미리 계산
+_F_TO_C_SCALE = 5.0 / 9.0
 
 # 타겟 인터페이스 (ABC 사용)
 class ICelsiusSensor(ABC):
@@ -40,8 +43,18 @@ class FahrenheitAdapter(ICelsiusSensor):
     
     def read_celsius(self) -> float:
         f = self.sensor.read_fahrenheit()
-        return (f - 32.0) * 5.0 / 9.0
-    
+        return (f - 32.0) * _F_TO_C_SCALE
+
+    def read_celsius_batch(self, n: int) -> List[float]:
+        """n개 샘플을 한 번에 읽어 일괄 변환
+
+        센서 스트림 처리 시 샘플마다 메서드를 호출하는 대신
+        읽기 함수를 지역 변수로 바인딩해 리스트 컴프리헨션 한 번으로 변환
+        """
+        read = self.sensor.read_fahrenheit  # 속성 조회를 루프 밖으로
+        scale = _F_TO_C_SCALE
+        return [(read() - 32.0) * scale for _ in range(n)]
+
     def get_name(self) -> str:
         return self.sensor.get_sensor_name()
 
@@ -61,7 +74,7 @@ def celsius_adapter(fahrenheit_func):
     """화씨 함수를 섭씨로 변환하는 데코레이터"""
     def wrapper(*args, **kwargs):
         f = fahrenheit_func(*args, **kwargs)
-        return (f - 32.0) * 5.0 / 9.0
+        return (f - 32.0) * _F_TO_C_SCALE
     return wrapper
 
 @celsius_adapter
@@ -81,6 +94,10 @@ def main():
     process_temperature(f_adapter)
     process_temperature(k_adapter)
     
+    print("\n배치 변환 (센서 스트림):")
+    batch = f_adapter.read_celsius_batch(3)
+    print(f"Batch: {[f'{c:.2f}' for c in batch]}")
+
     print("\n데코레이터 Adapter:")
     print(f"Room: {get_room_temperature():.2f}°C")
     
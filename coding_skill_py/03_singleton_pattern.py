@@ -9,15 +9,21 @@ from threading import Lock
 
 # 1. 메타클래스를 이용한 Singleton
 class SingletonMeta(type):
-    _instances = {}
     _lock = Lock()
-    
+
     def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            with cls._lock:
-                if cls not in cls._instances:
-                    cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
+        # 핫패스: 공유 dict 해시 조회 대신 클래스 자신의 __dict__에서
+        # 인스턴스를 바로 읽음 (MRO 탐색 없는 단일 로드, 락 없음)
+        inst = cls.__dict__.get('_singleton_instance')
+        if inst is not None:
+            return inst
+        with SingletonMeta._lock:
+            # 락 획득 후 재확인 (double-checked locking)
+            inst = cls.__dict__.get('_singleton_instance')
+            if inst is None:
+                inst = super().__call__(*args, **kwargs)
+                type.__setattr__(cls, '_singleton_instance', inst)
+        return inst
 
 class Logger(metaclass=SingletonMeta):
     def __init__(self):
@@ -42,17 +48,21 @@ class Config:
 
 # 3. 데코레이터를 이용한 Singleton
 def singleton(cls):
-    instances = {}
+    # cls 하나만 캐싱하므로 dict 대신 클로저 셀 하나 - 해시 조회 제거
+    instance = None
     lock = Lock()
-    
+
     @wraps(cls)
     def get_instance(*args, **kwargs):
-        if cls not in instances:
-            with lock:
-                if cls not in instances:
-                    instances[cls] = cls(*args, **kwargs)
-        return instances[cls]
-    
+        nonlocal instance
+        inst = instance  # 핫패스: 셀 로드 한 번
+        if inst is not None:
+            return inst
+        with lock:
+            if instance is None:
+                instance = cls(*args, **kwargs)
+        return instance
+
     return get_instance
 
 @singleton
@@ -1,6 +1,6 @@
-"""Python State Machine - Enum + dict"""
+"""Python State Machine - Enum + 정수 인덱스 디스패치"""
 from enum import Enum, auto
-from typing import Callable, Dict
+from typing import Callable, List, Optional
 
 class State(Enum):
     IDLE = auto()
@@ -8,18 +8,23 @@ class State(Enum):
     STOPPED = auto()
 
 class StateMachine:
+    # State 값은 auto()로 1부터 연속된 작은 정수이므로
+    # dict 해시 조회 대신 고정 길이 리스트를 value로 인덱싱 -
+    # 전이마다 enum 해시/비교 없이 C 레벨 배열 로드 한 번
     def __init__(self):
         self.current = State.IDLE
-        self.on_enter: Dict[State, Callable] = {}
-    
+        self.on_enter: List[Optional[Callable]] = \
+            [None] * (max(s.value for s in State) + 1)
+
     def set_on_enter(self, state: State, callback: Callable):
-        self.on_enter[state] = callback
-    
+        self.on_enter[state.value] = callback
+
     def transition(self, next_state: State):
         print(f"[SM] {self.current.name} → {next_state.name}")
         self.current = next_state
-        if next_state in self.on_enter:
-            self.on_enter[next_state]()
+        callback = self.on_enter[next_state.value]
+        if callback is not None:
+            callback()
 
 def main():
     print("\n=== Python State Machine ===")
@@ -1,4 +1,5 @@
 """Python Factory - classmethod와 딕셔너리"""
+import sys
 from abc import ABC, abstractmethod
 from typing import Dict, Type
 
@@ -23,13 +24,16 @@ class Factory:
     
     @classmethod
     def create(cls, product_type: str) -> Product:
-        if product_type in cls._products:
-            return cls._products[product_type]()
-        raise ValueError(f"Unknown type: {product_type}")
-    
+        # in 검사 + 인덱싱의 해시 조회 2회를 .get() 1회로 축소
+        product_cls = cls._products.get(product_type)
+        if product_cls is None:
+            raise ValueError(f"Unknown type: {product_type}")
+        return product_cls()
+
     @classmethod
     def register(cls, name: str, product_class: Type[Product]):
-        cls._products[name] = product_class
+        # 키를 인터닝해 두면 조회가 dict의 포인터 동일성 fast path를 탐
+        cls._products[sys.intern(name)] = product_class
 
 def main():
     print("\n=== Python Factory Pattern ===")
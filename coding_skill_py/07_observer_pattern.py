@@ -5,29 +5,38 @@ import weakref
 T = TypeVar('T')
 
 class Subject(Generic[T]):
+    # 옵저버 목록은 attach/detach 때만 바뀌고 통지는 매우 잦음 -
+    # 변경 시에만 튜플로 고정해 두면 _notify는 불변 연속 배열을
+    # 가드 없이 순회 (attach/detach 비용을 핫패스 밖으로 이동)
     def __init__(self):
         self._observers: List[Callable] = []
+        self._observers_tuple: tuple = ()
         self._data: T = None
-    
+
     def attach(self, observer: Callable):
         self._observers.append(observer)
-    
+        self._observers_tuple = tuple(self._observers)
+
     def detach(self, observer: Callable):
         self._observers.remove(observer)
-    
+        self._observers_tuple = tuple(self._observers)
+
     @property
     def data(self) -> T:
         return self._data
-    
+
     @data.setter
     def data(self, value: T):
         self._data = value
         self._notify()
-    
+
     def _notify(self):
-        print(f"[Subject] 통지: {len(self._observers)}명")
-        for obs in self._observers:
-            obs(self._data)
+        # 지역 변수 별칭으로 루프 내 속성 조회(LOAD_ATTR) 제거
+        observers = self._observers_tuple
+        data = self._data
+        print(f"[Subject] 통지: {len(observers)}명")
+        for obs in observers:
+            obs(data)
 
 def main():
     print("\n=== Python Observer Pattern ===")
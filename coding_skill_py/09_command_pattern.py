@@ -2,23 +2,28 @@
 from dataclasses import dataclass
 from typing import Callable, List
 
-@dataclass
+@dataclass(slots=True)
 class Command:
     execute: Callable
     undo: Callable
 
 class Invoker:
+    # 히스토리를 Command 객체 리스트 대신 실행/취소 콜러블의
+    # 평행 리스트(SoA)로 보관 - 재생/취소 시 스텝마다 dataclass
+    # 속성 조회 없이 리스트 인덱싱 + 호출만 수행
     def __init__(self):
-        self.history: List[Command] = []
-    
+        self._exec: List[Callable] = []
+        self._undo: List[Callable] = []
+
     def execute(self, command: Command):
         command.execute()
-        self.history.append(command)
-    
+        self._exec.append(command.execute)
+        self._undo.append(command.undo)
+
     def undo(self):
-        if self.history:
-            command = self.history.pop()
-            command.undo()
+        if self._undo:
+            self._exec.pop()
+            self._undo.pop()()
 
 def main():
     print("\n=== Python Command ===")
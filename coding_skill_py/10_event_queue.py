@@ -1,20 +1,22 @@
-"""Python Event Queue - queue.Queue와 asyncio"""
-from queue import Queue
+"""Python Event Queue - collections.deque와 asyncio"""
+from collections import deque
 from typing import Callable
 import asyncio
 
 class EventQueue:
+    # 단일 스레드 디스패처에는 queue.Queue의 Lock/Condition이 불필요 -
+    # deque의 append/popleft는 C로 구현되어 GIL 하에서 원자적
     def __init__(self):
-        self.events: Queue[Callable] = Queue()
-    
+        self.events: deque[Callable] = deque()
+
     def push(self, event: Callable):
-        self.events.put(event)
-        print(f"[Queue] 이벤트 추가 (크기: {self.events.qsize()})")
-    
+        self.events.append(event)
+        print(f"[Queue] 이벤트 추가 (크기: {len(self.events)})")
+
     def process(self):
-        while not self.events.empty():
+        while self.events:
             print("[Queue] 이벤트 처리")
-            event = self.events.get()
+            event = self.events.popleft()
             event()
 
 # Async 버전
@@ -1,26 +1,29 @@
 """Python Object Pool"""
-from typing import List, Generic, TypeVar, Callable
+from typing import Dict, List, Generic, TypeVar, Callable
 
 T = TypeVar('T')
 
 class ObjectPool(Generic[T]):
+    # in_use를 id() 키 dict로 관리 - 풀 객체는 동일성으로 추적하는 것이
+    # 맞고, release가 O(n) 선형 스캔(+임의의 __eq__ 호출) 대신 O(1)
     def __init__(self, factory: Callable[[], T], size: int):
         self.available: List[T] = [factory() for _ in range(size)]
-        self.in_use: List[T] = []
-    
+        self.in_use: Dict[int, T] = {}
+
     def acquire(self) -> T:
         if not self.available:
             return None
         obj = self.available.pop()
-        self.in_use.append(obj)
+        self.in_use[id(obj)] = obj
         return obj
-    
+
     def release(self, obj: T):
-        if obj in self.in_use:
-            self.in_use.remove(obj)
+        if self.in_use.pop(id(obj), None) is not None:
             self.available.append(obj)
 
 class Packet:
+    __slots__ = ('id', 'data')  # 풀에 대량 보관되므로 인스턴스 dict 제거
+
     def __init__(self):
         self.id = 0
         self.data = ""
@@ -2,6 +2,8 @@
 import sys
 
 class Buffer:
+    __slots__ = ()  # 속성 없는 핸들 객체 - 인스턴스 dict 제거
+
     def __init__(self):
         print("[Buffer] 생성")
     
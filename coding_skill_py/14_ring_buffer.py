@@ -1,4 +1,5 @@
-"""Python Ring Buffer - collections.deque"""
+"""Python Ring Buffer - collections.deque와 숫자 전용 특화 버전"""
+import array
 from collections import deque
 from typing import Generic, TypeVar
 
@@ -7,25 +8,77 @@ T = TypeVar('T')
 class RingBuffer(Generic[T]):
     def __init__(self, maxsize: int):
         self.buffer = deque(maxlen=maxsize)
-    
+
     def push(self, item: T):
         self.buffer.append(item)
-    
+
     def pop(self) -> T:
         return self.buffer.popleft()
-    
+
     def __len__(self):
         return len(self.buffer)
 
+class NumericRingBuffer:
+    """숫자 샘플 전용 링 버퍼 - 연속 타입 배열(array.array) 기반
+
+    deque는 임의 Python 객체를 담는 블록 연결 구조라 오디오/센서
+    샘플처럼 동일 타입 숫자에는 원소당 박싱 비용이 큼. 미리 할당한
+    연속 C 배열 + head/tail 정수 인덱스면 블록 push/pop이
+    랩어라운드 포함 슬라이스 복사 1~2회로 끝남
+    """
+    __slots__ = ('buf', 'size', 'head', 'tail', 'count')
+
+    def __init__(self, size: int, typecode: str = 'd'):
+        self.buf = array.array(typecode, [0]) * size  # 미리 할당
+        self.size = size
+        self.head = 0   # pop 위치
+        self.tail = 0   # push 위치
+        self.count = 0  # 저장된 원소 수
+
+    def __len__(self):
+        return self.count
+
+    def push_block(self, src) -> int:
+        """블록 단위 push - 수용 가능한 만큼 복사하고 개수 반환"""
+        if not isinstance(src, array.array):
+            src = array.array(self.buf.typecode, src)
+        n = min(len(src), self.size - self.count)
+        first = min(n, self.size - self.tail)
+        self.buf[self.tail:self.tail + first] = src[:first]
+        if n > first:  # 랩어라운드 - 두 번째 슬라이스 복사
+            self.buf[0:n - first] = src[first:n]
+        self.tail = (self.tail + n) % self.size
+        self.count += n
+        return n
+
+    def pop_block(self, n: int) -> array.array:
+        """블록 단위 pop - 최대 n개를 새 배열로 반환"""
+        n = min(n, self.count)
+        first = min(n, self.size - self.head)
+        out = self.buf[self.head:self.head + first]
+        if n > first:
+            out.extend(self.buf[0:n - first])
+        self.head = (self.head + n) % self.size
+        self.count -= n
+        return out
+
 def main():
     print("=== Python Ring Buffer ===")
     rb = RingBuffer[int](5)
-    
+
     for i in range(1, 4):
         rb.push(i * 10)
-    
+
     while len(rb) > 0:
         print(f"Pop: {rb.pop()}")
 
+    print("\n=== Numeric Ring Buffer (블록 단위) ===")
+    nrb = NumericRingBuffer(5, 'd')
+    pushed = nrb.push_block([1.0, 2.0, 3.0, 4.0])
+    print(f"Pushed: {pushed}, len: {len(nrb)}")
+    print(f"Pop block: {nrb.pop_block(2).tolist()}")
+    nrb.push_block([5.0, 6.0, 7.0])  # 랩어라운드 발생
+    print(f"Pop block: {nrb.pop_block(5).tolist()}")
+
 if __name__ == "__main__":
     main()
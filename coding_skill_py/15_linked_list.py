@@ -5,6 +5,10 @@ from typing import Optional, Generic, TypeVar
 T = TypeVar('T')
 
 class Node(Generic[T]):
+    # 노드가 대량 생성되는 자료구조이므로 __slots__로 인스턴스 dict 제거
+    # - 노드당 메모리 ~1/3, next 추적이 C 레벨 슬롯 로드
+    __slots__ = ('data', 'next')
+
     def __init__(self, data: T):
         self.data = data
         self.next: Optional[Node[T]] = None
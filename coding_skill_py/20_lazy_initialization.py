@@ -1,8 +1,29 @@
-"""Python Lazy Init - property"""
-from functools import cached_property
+"""Python Lazy Init - 커스텀 디스크립터"""
+
+class lazy:
+    """락 없는 지연 초기화 디스크립터
+
+    functools.cached_property는 첫 접근 시 RLock을 잡지만(버전에 따라
+    클래스 전체가 공유), 읽기 위주 필드에는 불필요한 비용.
+    첫 접근에서 값을 인스턴스 __dict__에 직접 넣으면 이후 접근은
+    디스크립터를 아예 거치지 않는 일반 속성 조회 한 번이 됨
+    (non-data 디스크립터는 인스턴스 dict가 우선이므로)
+    """
+    def __init__(self, fn):
+        self.fn = fn
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        value = self.fn(instance)
+        instance.__dict__[self.name] = value  # 이후 접근은 dict 조회 한 번
+        return value
 
 class LazyResource:
-    @cached_property
+    @lazy
     def data(self):
         print("[Lazy] 첫 접근! 초기화")
         return 100
@@ -3,17 +3,23 @@ import array
 
 def main():
     print("=== Python Zero-Copy (memoryview) ===")
-    
+
     data = array.array('i', range(10))
-    print(f"Original: {list(data)}")
-    
+    print(f"Original: {data.tolist()}")
+
     # memoryview로 복사 없이 접근
+    # 주의: list(view)는 원소를 모두 PyInt로 꺼내는 '복사'라서
+    # 제로카피 의도를 스스로 깨뜨림 - 뷰는 뷰인 채로 다뤄야 함
     view = memoryview(data)
-    print(f"View: {list(view)}")
-    
-    # 슬라이스도 복사 없음
+    assert view.obj is data  # 버퍼를 공유한다는 불변식
+
+    # 슬라이스도 복사 없음 - 같은 버퍼의 다른 창
     subview = view[2:5]
-    print(f"Subview: {list(subview)}")
+    print(f"Subview length: {len(subview)}, shares buffer: {subview.obj is data}")
+
+    # 뷰를 통한 제자리 수정 - 원본 array가 그대로 바뀜 (복사 0회)
+    subview[:] = array.array('i', (x * 2 for x in subview))
+    print(f"After in-place doubling via view: {data.tolist()}")
 
 if __name__ == "__main__":
     main()
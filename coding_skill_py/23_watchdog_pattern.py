@@ -2,16 +2,18 @@
 import time
 
 class Watchdog:
-    def __init__(self, timeout: int):
-        self.timeout = timeout
+    # time.time()은 float 반환 + NTP 보정으로 뒤로 갈 수 있음
+    # monotonic_ns는 단조 증가 정수라 비교가 정확하고
+    # 폴링마다 PyFloat 할당이 없음
+    def __init__(self, timeout: float):
+        self.timeout_ns = int(timeout * 1e9)
         self.kick()
-    
+
     def kick(self):
-        self.last_kick = time.time()
-    
+        self.last_kick = time.monotonic_ns()
+
     def check(self) -> bool:
-        elapsed = time.time() - self.last_kick
-        return elapsed < self.timeout
+        return (time.monotonic_ns() - self.last_kick) < self.timeout_ns
 
 def main():
     print("=== Python Watchdog ===")
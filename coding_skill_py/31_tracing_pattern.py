@@ -4,18 +4,23 @@ from typing import Callable
 
 _trace_depth = 0
 
+# 들여쓰기 버퍼를 한 번만 만들어 두고 슬라이스로 잘라 씀 -
+# 진입/복귀마다 " " * depth로 새 문자열을 할당(깊은 재귀에서 O(depth^2)
+# 총 할당)하는 대신 O(1) 슬라이스 한 번
+_INDENT = " " * 256
+
 def trace(func: Callable) -> Callable:
     @wraps(func)
     def wrapper(*args, **kwargs):
         global _trace_depth
-        print(" " * _trace_depth + f"→ {func.__name__}()")
+        print(_INDENT[:min(_trace_depth, 256)] + f"→ {func.__name__}()")
         _trace_depth += 1
         try:
             result = func(*args, **kwargs)
             return result
         finally:
             _trace_depth -= 1
-            print(" " * _trace_depth + f"← {func.__name__}()")
+            print(_INDENT[:min(_trace_depth, 256)] + f"← {func.__name__}()")
     return wrapper
 
 @trace